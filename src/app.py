@@ -25,55 +25,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Join our competitive basketball team and participate in games and tournaments",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu"]
+        "participants": {"james@mergington.edu"}
     },
     "Tennis Club": {
         "description": "Learn tennis skills and compete in matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
         "max_participants": 10,
-        "participants": ["sarah@mergington.edu"]
+        "participants": {"sarah@mergington.edu"}
     },
     "Art Club": {
         "description": "Explore painting, drawing, and other visual arts",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["grace@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"grace@mergington.edu", "lucas@mergington.edu"}
     },
     "Theater Club": {
         "description": "Perform in school plays and develop acting skills",
         "schedule": "Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["ashley@mergington.edu"]
+        "participants": {"ashley@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking through competitive debate",
         "schedule": "Mondays and Fridays, 3:30 PM - 4:30 PM",
         "max_participants": 12,
-        "participants": ["david@mergington.edu", "isabella@mergington.edu"]
+        "participants": {"david@mergington.edu", "isabella@mergington.edu"}
     },
     "Science Club": {
         "description": "Conduct experiments and explore advanced scientific concepts",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["alex@mergington.edu"]
+        "participants": {"alex@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
@@ -85,7 +85,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; return them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -98,8 +102,12 @@ def signup_for_activity(activity_name: str, email: str):
     # Get the specific activity
     activity = activities[activity_name]
 
+    # Validate student is not already signed up
+    if email in activity["participants"]:
+        raise HTTPException(status_code=400, detail="Student already signed up")
+
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -1,93 +1,242 @@
 """
 Pytest configuration and fixtures for FastAPI tests
 """
-import sys
-from pathlib import Path
+import functools
+import pickle
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
+import app as app_module
 from app import app
+from helpers import ASYNC_BASE_URL
+
+# Pristine activities as (static fields, participants) pairs, taken from the
+# app's seed data before tracked_db swaps it out. Only the participants ever
+# change, so the static fields are shared by every restore and the
+# participants are kept as frozensets to copy from.
+_PROTOTYPE = {
+    key: (
+        {field: value for field, value in activity.items() if field != "participants"},
+        frozenset(activity["participants"]),
+    )
+    for key, activity in app_module.activities.items()
+}
+
+
+@functools.cache
+def _prototype_bytes():
+    return pickle.dumps(_PROTOTYPE, protocol=5)
 
 
-@pytest.fixture
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand each xdist worker the prototype built once in the controller"""
+    node.workerinput["activities_prototype"] = _prototype_bytes()
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Provide a TestClient for testing the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_db():
-    """Reset the activities database to initial state before each test"""
-    from app import activities as app_activities
-    
-    # Save original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Join our competitive basketball team and participate in games and tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Learn tennis skills and compete in matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": ["sarah@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore painting, drawing, and other visual arts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["grace@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Theater Club": {
-            "description": "Perform in school plays and develop acting skills",
-            "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["ashley@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through competitive debate",
-            "schedule": "Mondays and Fridays, 3:30 PM - 4:30 PM",
-            "max_participants": 12,
-            "participants": ["david@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore advanced scientific concepts",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Reset before test
-    app_activities.clear()
-    app_activities.update({k: {**v, "participants": v["participants"].copy()} for k, v in original_activities.items()})
-    
-    yield
-    
-    # Reset after test
-    app_activities.clear()
-    app_activities.update({k: {**v, "participants": v["participants"].copy()} for k, v in original_activities.items()})
+    """Provide a single TestClient shared by the whole test session"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Provide an httpx AsyncClient that drives the app directly over ASGI"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url=ASYNC_BASE_URL) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warmup(client):
+    """Hit the app once so one-time routing setup happens before any test"""
+    client.get("/activities")
+    client.get("/", follow_redirects=False)
+
+
+class TrackedSet(set):
+    """Participant set that marks its activity dirty when mutated"""
+
+    def __init__(self, items, dirty_keys, key):
+        super().__init__(items)
+        self._dirty_keys = dirty_keys
+        self._key = key
+
+    def _mark_dirty(self):
+        self._dirty_keys.add(self._key)
+
+    def add(self, item):
+        self._mark_dirty()
+        super().add(item)
+
+    def update(self, *others):
+        self._mark_dirty()
+        super().update(*others)
+
+    def remove(self, item):
+        self._mark_dirty()
+        super().remove(item)
+
+    def discard(self, item):
+        self._mark_dirty()
+        super().discard(item)
+
+    def pop(self):
+        self._mark_dirty()
+        return super().pop()
+
+    def clear(self):
+        self._mark_dirty()
+        super().clear()
+
+    def difference_update(self, *others):
+        self._mark_dirty()
+        super().difference_update(*others)
+
+    def intersection_update(self, *others):
+        self._mark_dirty()
+        super().intersection_update(*others)
+
+    def symmetric_difference_update(self, other):
+        self._mark_dirty()
+        super().symmetric_difference_update(other)
+
+    def __ior__(self, other):
+        self._mark_dirty()
+        return super().__ior__(other)
+
+    def __iand__(self, other):
+        self._mark_dirty()
+        return super().__iand__(other)
+
+    def __isub__(self, other):
+        self._mark_dirty()
+        return super().__isub__(other)
+
+    def __ixor__(self, other):
+        self._mark_dirty()
+        return super().__ixor__(other)
+
+
+class _TrackedMapping(dict):
+    """Dict that reports every key it mutates to a ``mark`` callable"""
+
+    def __init__(self, fields, mark):
+        super().__init__(fields)
+        self._mark = mark
+
+    def __setitem__(self, key, value):
+        self._mark(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._mark(key)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        self._mark(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._mark(key)
+        return key, value
+
+    def clear(self):
+        for key in self:
+            self._mark(key)
+        super().clear()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._mark(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        for key in other:
+            self._mark(key)
+        super().update(other)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+class TrackedActivity(_TrackedMapping):
+    """Single activity entry that marks itself replaced when a field changes"""
+
+    def __init__(self, fields, db, key):
+        super().__init__(fields, lambda _field: db._mark_key(key))
+
+
+class TrackedDict(_TrackedMapping):
+    """Activities database that records which activities a test touched"""
+
+    def __init__(self, prototype):
+        super().__init__((), self._mark_key)
+        self._prototype = prototype
+        self.dirty_keys = set()
+        self.replaced_keys = set()
+        for key in prototype:
+            self.restore(key)
+
+    def _mark_key(self, key):
+        self.dirty_keys.add(key)
+        self.replaced_keys.add(key)
+
+    def restore(self, key):
+        """Put a single activity back to its pristine state
+
+        Activities that were only touched through their participant set are
+        reset in place. Replaced, edited or missing entries are rebuilt from
+        the shared static fields and a fresh copy of the initial participants.
+        """
+        if key not in self._prototype:
+            dict.pop(self, key, None)
+            return
+        static, initial_participants = self._prototype[key]
+        if key in self and key not in self.replaced_keys:
+            participants = self[key]["participants"]
+            participants.clear()
+            participants.update(initial_participants)
+            return
+        dict.__setitem__(self, key, TrackedActivity({
+            **static,
+            "participants": TrackedSet(initial_participants, self.dirty_keys, key),
+        }, self, key))
+
+    def rollback(self):
+        """Restore every activity touched since the last rollback"""
+        for key in list(self.dirty_keys):
+            self.restore(key)
+        self.dirty_keys.clear()
+        self.replaced_keys.clear()
+
+
+@pytest.fixture(scope="session")
+def prototype(pytestconfig):
+    """Load the controller's prototype on xdist workers, or build it locally"""
+    workerinput = getattr(pytestconfig, "workerinput", None)
+    if workerinput is None:
+        return _PROTOTYPE
+    return pickle.loads(workerinput["activities_prototype"])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tracked_db(prototype):
+    """Swap the app's activities database for a write-tracking copy
+
+    Under pytest-xdist (``pytest -n auto``) every worker is its own process
+    with its own imported ``app`` module, so each worker tracks and restores
+    a private database and tests never contend across workers.
+    """
+    db = TrackedDict(prototype)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(app_module, "activities", db)
+        yield db
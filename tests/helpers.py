@@ -0,0 +1,35 @@
+"""
+Helpers shared by the test modules and conftest
+"""
+import contextlib
+
+import orjson
+
+import app as app_module
+
+ASYNC_BASE_URL = "http://test"
+
+
+def read_json(response):
+    """Decode a response body with orjson instead of the stdlib json module"""
+    return orjson.loads(response.content)
+
+
+def activities_state():
+    """Return the app's live activities database for in-process assertions"""
+    return app_module.activities
+
+
+@contextlib.contextmanager
+def fresh_db():
+    """Run the block against a pristine database and restore it afterwards
+
+    Anything left dirty by an earlier test is rolled back on entry too, so a
+    test that mutated state outside ``fresh_db`` cannot leak into this one.
+    """
+    db = app_module.activities
+    db.rollback()
+    try:
+        yield db
+    finally:
+        db.rollback()
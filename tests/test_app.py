@@ -1,15 +1,62 @@
 """
 Tests for the FastAPI application endpoints
+
+PYTEST_DONT_REWRITE: the assertions here are simple enough that pytest's
+assertion rewriting is not worth its collection-time cost.
 """
+import httpx
 import pytest
 
+from helpers import ASYNC_BASE_URL, activities_state, fresh_db, read_json
+
+CHESS_SIGNUP_URL = "/activities/Chess%20Club/signup"
+CHESS_UNREGISTER_URL = "/activities/Chess%20Club/unregister"
+MISSING_SIGNUP_URL = "/activities/NonExistent%20Activity/signup"
+MISSING_UNREGISTER_URL = "/activities/NonExistent%20Activity/unregister"
+
+REQUIRED_FIELDS = frozenset(
+    {"description", "schedule", "max_participants", "participants"}
+)
+
+NEW_STUDENTS = [
+    "newstudent@mergington.edu",
+    "student1@mergington.edu",
+    "student2@mergington.edu",
+]
+
+# Signup requests for the parametrized test_signup_success only, built once at
+# collection time and sent as-is with async_client.send(). send() skips the
+# client's base_url merging and default headers, so the URLs are absolute and
+# must use the same ASYNC_BASE_URL the async_client fixture is created with.
+# Every other async test goes through async_client.post()/delete() as usual.
+SIGNUP_REQUESTS = [
+    pytest.param(
+        email,
+        httpx.Request("POST", ASYNC_BASE_URL + CHESS_SIGNUP_URL, params={"email": email}),
+        id=email,
+    )
+    for email in NEW_STUDENTS
+]
+
+# Bound once per session so the sync tests skip a per-test fixture lookup
+CLIENT = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def bind_client(client):
+    """Expose the session TestClient as the module-level CLIENT"""
+    global CLIENT
+    CLIENT = client
+    yield
+    CLIENT = None
+
 
 class TestRoot:
     """Tests for the root endpoint"""
 
-    def test_root_redirect(self, client):
+    def test_root_redirect(self):
         """Test that root endpoint redirects to /static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = CLIENT.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert "/static/index.html" in response.headers["location"]
 
@@ -17,158 +64,187 @@ class TestRoot:
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
 
-    def test_get_activities_returns_all(self, client, reset_db):
+    def test_get_activities_returns_all(self):
         """Test that get_activities returns all activities"""
-        response = client.get("/activities")
+        response = CLIENT.get("/activities")
         assert response.status_code == 200
         
-        data = response.json()
+        data = read_json(response)
         assert isinstance(data, dict)
         assert "Chess Club" in data
         assert "Basketball Team" in data
         assert "Tennis Club" in data
         assert len(data) == 9
 
-    def test_get_activities_contains_required_fields(self, client, reset_db):
+    def test_get_activities_contains_required_fields(self):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        data = response.json()
+        response = CLIENT.get("/activities")
+        data = read_json(response)
         
-        for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
+        for activity_data in data.values():
+            assert REQUIRED_FIELDS <= activity_data.keys()
             assert isinstance(activity_data["participants"], list)
 
-    def test_get_activities_participants_are_strings(self, client, reset_db):
+    def test_get_activities_participants_are_strings(self):
         """Test that participants are strings (emails)"""
-        response = client.get("/activities")
-        data = response.json()
+        response = CLIENT.get("/activities")
+        data = read_json(response)
         
         for activity_data in data.values():
             for participant in activity_data["participants"]:
                 assert isinstance(participant, str)
                 assert "@" in participant
 
+    def test_get_activities_participants_are_sorted(self):
+        """Test that participants are returned as sorted lists"""
+        response = CLIENT.get("/activities")
+        data = read_json(response)
+
+        for activity_data in data.values():
+            participants = activity_data["participants"]
+            assert participants == sorted(participants)
+
 
+@pytest.mark.asyncio
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_success(self, client, reset_db):
+    @pytest.mark.parametrize("email, request_", SIGNUP_REQUESTS)
+    async def test_signup_success(self, async_client, email, request_):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert "message" in data
-        assert "Signed up newstudent@mergington.edu" in data["message"]
-
-    def test_signup_adds_participant(self, client, reset_db):
+        with fresh_db():
+            response = await async_client.send(request_)
+            assert response.status_code == 200
+            
+            data = read_json(response)
+            assert "message" in data
+            assert f"Signed up {email}" in data["message"]
+
+    async def test_signup_adds_participant(self, async_client):
         """Test that signup actually adds the participant"""
-        email = "newstudent@mergington.edu"
-        
-        # Signup
-        response = client.post(f"/activities/Chess%20Club/signup?email={email}")
-        assert response.status_code == 200
-        
-        # Verify participant was added
-        activities = client.get("/activities").json()
-        assert email in activities["Chess Club"]["participants"]
-
-    def test_signup_activity_not_found(self, client, reset_db):
+        with fresh_db():
+            email = "newstudent@mergington.edu"
+            
+            # Signup
+            response = await async_client.post(CHESS_SIGNUP_URL, params={"email": email})
+            assert response.status_code == 200
+            
+            # Verify participant was added
+            assert email in activities_state()["Chess Club"]["participants"]
+
+    async def test_signup_activity_not_found(self, async_client):
         """Test signup for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/NonExistent%20Activity/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-
-    def test_signup_multiple_students(self, client, reset_db):
+        with fresh_db():
+            response = await async_client.post(
+                MISSING_SIGNUP_URL, params={"email": "student@mergington.edu"}
+            )
+            assert response.status_code == 404
+            assert read_json(response)["detail"] == "Activity not found"
+
+    async def test_signup_multiple_students(self, async_client):
         """Test that multiple students can sign up for same activity"""
-        # First signup
-        response1 = client.post(
-            "/activities/Chess%20Club/signup?email=student1@mergington.edu"
-        )
-        assert response1.status_code == 200
-        
-        # Second signup
-        response2 = client.post(
-            "/activities/Chess%20Club/signup?email=student2@mergington.edu"
-        )
-        assert response2.status_code == 200
-        
-        # Verify both are enrolled
-        activities = client.get("/activities").json()
-        participants = activities["Chess Club"]["participants"]
-        assert "student1@mergington.edu" in participants
-        assert "student2@mergington.edu" in participants
-
-
+        with fresh_db():
+            # First signup
+            response1 = await async_client.post(
+                CHESS_SIGNUP_URL, params={"email": "student1@mergington.edu"}
+            )
+            assert response1.status_code == 200
+            
+            # Second signup
+            response2 = await async_client.post(
+                CHESS_SIGNUP_URL, params={"email": "student2@mergington.edu"}
+            )
+            assert response2.status_code == 200
+            
+            # Verify both are enrolled
+            participants = activities_state()["Chess Club"]["participants"]
+            assert "student1@mergington.edu" in participants
+            assert "student2@mergington.edu" in participants
+
+    async def test_signup_twice_is_rejected(self, async_client):
+        """Test that signing up the same student twice fails and stores one entry"""
+        with fresh_db():
+            email = "newstudent@mergington.edu"
+            initial_count = len(activities_state()["Chess Club"]["participants"])
+
+            response1 = await async_client.post(CHESS_SIGNUP_URL, params={"email": email})
+            assert response1.status_code == 200
+
+            response2 = await async_client.post(CHESS_SIGNUP_URL, params={"email": email})
+            assert response2.status_code == 400
+            assert read_json(response2)["detail"] == "Student already signed up"
+
+            participants = read_json(await async_client.get("/activities"))["Chess Club"]["participants"]
+            assert participants.count(email) == 1
+            assert len(participants) == initial_count + 1
+
+
+@pytest.mark.asyncio
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_success(self, client, reset_db):
+    async def test_unregister_success(self, async_client):
         """Test successful unregister from an activity"""
-        email = "michael@mergington.edu"
-        
-        response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert "message" in data
-        assert "Removed" in data["message"]
-
-    def test_unregister_removes_participant(self, client, reset_db):
+        with fresh_db():
+            email = "michael@mergington.edu"
+            
+            response = await async_client.delete(
+                CHESS_UNREGISTER_URL, params={"email": email}
+            )
+            assert response.status_code == 200
+            
+            data = read_json(response)
+            assert "message" in data
+            assert "Removed" in data["message"]
+
+    async def test_unregister_removes_participant(self, async_client):
         """Test that unregister actually removes the participant"""
-        email = "michael@mergington.edu"
-        
-        # Verify participant exists before unregister
-        activities_before = client.get("/activities").json()
-        assert email in activities_before["Chess Club"]["participants"]
-        
-        # Unregister
-        response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
-        assert response.status_code == 200
-        
-        # Verify participant was removed
-        activities_after = client.get("/activities").json()
-        assert email not in activities_after["Chess Club"]["participants"]
-
-    def test_unregister_activity_not_found(self, client, reset_db):
+        with fresh_db():
+            email = "michael@mergington.edu"
+            
+            # Verify participant exists before unregister
+            assert email in activities_state()["Chess Club"]["participants"]
+            
+            # Unregister
+            response = await async_client.delete(
+                CHESS_UNREGISTER_URL, params={"email": email}
+            )
+            assert response.status_code == 200
+            
+            # Verify participant was removed
+            assert email not in activities_state()["Chess Club"]["participants"]
+
+    async def test_unregister_activity_not_found(self, async_client):
         """Test unregister from non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/NonExistent%20Activity/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-
-    def test_unregister_participant_not_found(self, client, reset_db):
+        with fresh_db():
+            response = await async_client.delete(
+                MISSING_UNREGISTER_URL, params={"email": "student@mergington.edu"}
+            )
+            assert response.status_code == 404
+            assert read_json(response)["detail"] == "Activity not found"
+
+    async def test_unregister_participant_not_found(self, async_client):
         """Test unregister for non-existent participant returns 404"""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=nonexistent@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Participant not found"
-
-    def test_unregister_multiple_times(self, client, reset_db):
+        with fresh_db():
+            response = await async_client.delete(
+                CHESS_UNREGISTER_URL, params={"email": "nonexistent@mergington.edu"}
+            )
+            assert response.status_code == 404
+            assert read_json(response)["detail"] == "Participant not found"
+
+    async def test_unregister_multiple_times(self, async_client):
         """Test that unregistering same participant twice fails appropriately"""
-        email = "michael@mergington.edu"
-        
-        # First unregister succeeds
-        response1 = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
-        assert response1.status_code == 200
-        
-        # Second unregister should fail
-        response2 = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
-        assert response2.status_code == 404
+        with fresh_db():
+            email = "michael@mergington.edu"
+            
+            # First unregister succeeds
+            response1 = await async_client.delete(
+                CHESS_UNREGISTER_URL, params={"email": email}
+            )
+            assert response1.status_code == 200
+            
+            # Second unregister should fail
+            response2 = await async_client.delete(
+                CHESS_UNREGISTER_URL, params={"email": email}
+            )
+            assert response2.status_code == 404